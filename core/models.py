@@ -1,6 +1,7 @@
 """Core data models for scoresheet and voting results."""
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Any, Self
 
 
@@ -52,6 +53,35 @@ class Scoresheet:
         judge_rankings = self.rankings[judge]
         return sorted(self.competitors, key=lambda c: judge_rankings[c])
 
+    @cached_property
+    def ranking_indices(self) -> list[list[int]]:
+        """Each judge's ranking (1st to last) as indices into competitors.
+
+        Rows follow the order of judges. Computed once on first access and
+        shared by every voting system run on this scoresheet, so the
+        scoresheet must not be modified after it's first accessed.
+        """
+        comp_idx = {c: i for i, c in enumerate(self.competitors)}
+        return [
+            [comp_idx[c] for c in self.get_judge_ranking(judge)]
+            for judge in self.judges
+        ]
+
+    @cached_property
+    def distinct_rankings(self) -> list[tuple[list[int], int]]:
+        """Each distinct judge ranking, with the number of judges who gave it.
+
+        Rankings are as in ranking_indices, listed in order of the first
+        judge to give each one. Useful to methods that only care how many
+        judges gave a ranking, not which ones, since identical rankings are
+        common with few competitors.
+        """
+        counts: dict[tuple[int, ...], int] = {}
+        for ranking in self.ranking_indices:
+            key = tuple(ranking)
+            counts[key] = counts.get(key, 0) + 1
+        return [(list(ranking), count) for ranking, count in counts.items()]
+
 
 @dataclass
 class Placement:
@@ -41,11 +41,8 @@ class EeproParser(ScoresheetParser):
 
         Tell-tale sign: The <title> tag contains "Event Express Pro".
         """
-        try:
-            html = content.decode("utf-8", errors="replace")
-        except Exception:
-            return False
-        return "event express pro" in html.lower()
+        # The signature is ASCII, so it can be found without decoding
+        return b"event express pro" in content.lower()
 
     def parse(self, source: str, content: bytes, division: str | None = None) -> Scoresheet:
         """Parse eepro.com HTML content into a Scoresheet.
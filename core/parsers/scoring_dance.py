@@ -45,13 +45,10 @@ class ScoringDanceParser(ScoresheetParser):
         Tell-tale sign: JSON-LD script block with @type DanceEvent
         and judges_placements data.
         """
-        try:
-            html = content.decode("utf-8", errors="replace")
-        except Exception:
-            return False
+        # Both markers are ASCII, so they can be found without decoding
         return (
-            "application/ld+json" in html
-            and '"DanceEvent"' in html
+            b"application/ld+json" in content
+            and b'"DanceEvent"' in content
         )
 
     def parse(self, source: str, content: bytes, division: str | None = None) -> Scoresheet:
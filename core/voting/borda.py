@@ -48,13 +48,20 @@ class BordaCountSystem(VotingSystem):
         scores: dict[str, int] = {c: 0 for c in competitors}
         breakdowns: dict[str, list[int]] = {c: [] for c in competitors}
 
-        for judge in scoresheet.judges:
-            # Sort competitors by this judge's placement (relative ranking)
-            ranked = sorted(competitors, key=lambda c: scoresheet.get_placement(judge, c))
-            for position, competitor in enumerate(ranked):
-                points = k - 1 - position  # 1st = k-1, last = 0
-                scores[competitor] += points
-                breakdowns[competitor].append(points)
+        all_competitors = scoresheet.competitors
+        members = {i for i, c in enumerate(all_competitors) if c in scores}
+
+        for ranking in scoresheet.ranking_indices:
+            # Walk this judge's (already sorted) ranking, skipping competitors
+            # outside the subset, to get their relative ranking
+            position = 0
+            for idx in ranking:
+                if idx in members:
+                    competitor = all_competitors[idx]
+                    points = k - 1 - position  # 1st = k-1, last = 0
+                    scores[competitor] += points
+                    breakdowns[competitor].append(points)
+                    position += 1
 
         return scores, breakdowns
 
@@ -30,6 +30,7 @@ class RelativePlacementSystem(VotingSystem):
         return "WCS standard: place when majority of judges rank you at that place or better"
 
     def calculate(self, scoresheet: Scoresheet) -> VotingResult:
+        competitors = scoresheet.competitors
         n = scoresheet.num_competitors
         m = scoresheet.num_judges
         majority = m // 2 + 1
@@ -39,7 +40,8 @@ class RelativePlacementSystem(VotingSystem):
         cum_counts = self._compute_cumulative_counts(scoresheet)
 
         final_ranking: list[str | list[str]] = []
-        unplaced = set(scoresheet.competitors)
+        num_placed = 0
+        unplaced = set(competitors)
         round_details = []
 
         # Process cutoffs methodically: at each cutoff, resolve ALL competitors
@@ -52,7 +54,7 @@ class RelativePlacementSystem(VotingSystem):
             # Find all unplaced competitors with majority at this cutoff,
             # preserving the original competitor order for determinism
             with_majority = [
-                c for c in scoresheet.competitors
+                c for c in competitors
                 if c in unplaced and cum_counts[c][current_cutoff] >= majority
             ]
 
@@ -62,10 +64,7 @@ class RelativePlacementSystem(VotingSystem):
 
             # Place all competitors with majority at this cutoff
             while with_majority:
-                target_place = sum(
-                    len(e) if isinstance(e, list) else 1
-                    for e in final_ranking
-                ) + 1
+                target_place = num_placed + 1
 
                 round_info = {
                     "target_place": target_place,
@@ -90,6 +89,7 @@ class RelativePlacementSystem(VotingSystem):
                         }],
                     }
                     final_ranking.append(winner)
+                    num_placed += 1
                     unplaced.discard(winner)
                     with_majority = []
                 else:
@@ -104,6 +104,7 @@ class RelativePlacementSystem(VotingSystem):
                         round_info["winners"] = winner
                         round_info["tied"] = True
                         final_ranking.append(list(winner))
+                        num_placed += len(winner)
                         placed = set(winner)
                         for w in winner:
                             unplaced.discard(w)
@@ -114,6 +115,7 @@ class RelativePlacementSystem(VotingSystem):
                         round_info["winner"] = winner
                         round_info["tied"] = False
                         final_ranking.append(winner)
+                        num_placed += 1
                         unplaced.discard(winner)
                         with_majority.remove(winner)
 
@@ -127,7 +129,7 @@ class RelativePlacementSystem(VotingSystem):
             details={
                 "majority_threshold": majority,
                 "cumulative_counts": {
-                    c: cum_counts[c] for c in scoresheet.competitors
+                    c: cum_counts[c] for c in competitors
                 },
                 "rounds": round_details,
             },
@@ -144,13 +146,14 @@ class RelativePlacementSystem(VotingSystem):
         n = scoresheet.num_competitors
         cum_counts = {}
 
-        for competitor in scoresheet.competitors:
-            # counts[i] = number of judges ranking at exactly place i
-            counts = [0] * (n + 1)  # 1-indexed
-            for judge in scoresheet.judges:
-                placement = scoresheet.get_placement(judge, competitor)
-                counts[placement] += 1
+        # all_counts[competitor][i] = number of judges ranking at exactly place i
+        all_counts = {c: [0] * (n + 1) for c in scoresheet.competitors}  # 1-indexed
+        for judge in scoresheet.judges:
+            judge_placements = scoresheet.rankings[judge]
+            for competitor, counts in all_counts.items():
+                counts[judge_placements[competitor]] += 1
 
+        for competitor, counts in all_counts.items():
             # Convert to cumulative: cum[i] = judges at place i or better
             cumulative = [0] * (n + 1)
             running_total = 0
@@ -231,7 +234,7 @@ class RelativePlacementSystem(VotingSystem):
             # Tiebreaker 2: Quality of majority (sum of best placements)
             quality = {}
             for c in candidates:
-                placements = [scoresheet.get_placement(j, c) for j in scoresheet.judges]
+                placements = scoresheet.get_competitor_placements(c)
                 # Sum the placements that are part of the current majority
                 quality[c] = sum(p for p in placements if p <= current_cutoff)
 
@@ -281,8 +284,10 @@ class RelativePlacementSystem(VotingSystem):
         assert len(candidates) == 2
         a, b = candidates
         a_better = sum(
-            1 for j in scoresheet.judges
-            if scoresheet.get_placement(j, a) < scoresheet.get_placement(j, b)
+            pa < pb for pa, pb in zip(
+                scoresheet.get_competitor_placements(a),
+                scoresheet.get_competitor_placements(b),
+            )
         )
         b_better = scoresheet.num_judges - a_better
         counts = {a: a_better, b: b_better}
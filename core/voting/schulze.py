@@ -34,18 +34,17 @@ class SchulzeSystem(VotingSystem):
     def calculate(self, scoresheet: Scoresheet) -> VotingResult:
         competitors = scoresheet.competitors
         n = len(competitors)
-        comp_idx = {c: i for i, c in enumerate(competitors)}
 
         # Step 1: Build pairwise preference matrix
         # d[i][j] = number of judges who prefer competitor i over competitor j
         d = [[0] * n for _ in range(n)]
 
-        for judge in scoresheet.judges:
-            ranking = scoresheet.get_judge_ranking(judge)
-            for i, comp_a in enumerate(ranking):
-                for comp_b in ranking[i + 1:]:
-                    # comp_a is ranked higher (better) than comp_b
-                    d[comp_idx[comp_a]][comp_idx[comp_b]] += 1
+        for ranking, count in scoresheet.distinct_rankings:
+            for pos, a in enumerate(ranking):
+                row = d[a]
+                for b in ranking[pos + 1:]:
+                    # a is ranked higher (better) than b by count judges
+                    row[b] += count
 
         # Step 2: Calculate strongest path strengths
         # Using "winning votes" as the strength measure
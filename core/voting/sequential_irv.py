@@ -1,12 +1,42 @@
 """Sequential Instant Runoff Voting (IRV) system."""
 
 import random
+from collections.abc import Iterable
 
 from core.models import Placement, Scoresheet, VotingResult
 from core.voting import register_voting_system
 from core.voting.base import VotingSystem
 
 
+def _indices_mask(indices: Iterable[int]) -> int:
+    """Return a bitmask with bit i set for each competitor index i."""
+    mask = 0
+    for i in indices:
+        mask |= 1 << i
+    return mask
+
+
+def _mask_indices(mask: int) -> list[int]:
+    """Return the competitor indices whose bits are set in mask, lowest first."""
+    indices = []
+    while mask:
+        low = mask & -mask
+        indices.append(low.bit_length() - 1)
+        mask ^= low
+    return indices
+
+
+def _fewest_votes(votes: dict[int, int]) -> list[int]:
+    """Return the candidates in votes with the fewest votes, in index order."""
+    min_votes = min(votes.values())
+    return [c for c, v in votes.items() if v == min_votes]
+
+
+def _by_name(votes: dict[int, int], competitors: list[str]) -> dict[str, int]:
+    """Return a copy of votes keyed by competitor name, for the details."""
+    return {competitors[c]: v for c, v in votes.items()}
+
+
 @register_voting_system
 class SequentialIRVSystem(VotingSystem):
     """Sequential Instant Runoff Voting system.
@@ -28,7 +58,8 @@ class SequentialIRVSystem(VotingSystem):
       eliminate. If all choices are equal, declare all tied equal.
     - Elimination: Restricted vote counting among tied candidates,
       narrowing the tied set until resolved.
-    - If still unresolved, choose at random.
+    - If still unresolved, choose at random (seeded from the competitor
+      names, so the same scoresheet always gives the same result).
     """
 
     @property
@@ -40,14 +71,26 @@ class SequentialIRVSystem(VotingSystem):
         return "Run Instant Runoff Voting repeatedly: find winner, remove, repeat"
 
     def calculate(self, scoresheet: Scoresheet) -> VotingResult:
+        # Candidates are handled as indices into scoresheet.competitors
+        # throughout, and only turned back into names for the details.
+        competitors = scoresheet.competitors
         final_ranking: list[str | list[str]] = []
-        remaining = set(scoresheet.competitors)
+        # Bitmask of unplaced candidates: bit i is set if competitor i remains
+        remaining = (1 << scoresheet.num_competitors) - 1
         placement_rounds = []
+        # Preference tallies keyed by candidate bitmask, shared across
+        # placements since the same tied sets tend to recur as the field shrinks
+        tally_cache: dict[int, list[dict[int, int]]] = {}
+        # Deterministic elimination tiebreak results, keyed by tied bitmask
+        tiebreak_cache: dict[int, tuple[int, dict]] = {}
+        # Seeded from the competitors so that random tiebreaks are
+        # reproducible for a given scoresheet
+        rng = random.Random("\n".join(sorted(competitors)))
 
         place = 1
         while remaining:
-            if len(remaining) == 1:
-                winner = remaining.pop()
+            if not remaining & (remaining - 1):  # exactly one bit set
+                winner = competitors[remaining.bit_length() - 1]
                 final_ranking.append(winner)
                 placement_rounds.append({
                     "place": place,
@@ -57,24 +100,22 @@ class SequentialIRVSystem(VotingSystem):
                 })
                 break
 
-            winner, irv_details = self._run_irv(remaining, scoresheet)
+            winners, irv_details = self._run_irv(
+                remaining, scoresheet, tally_cache, tiebreak_cache, rng,
+            )
+
+            # More than one winner means a tie - add all tied competitors
+            names = [competitors[w] for w in winners]
+            entry = names if len(names) > 1 else names[0]
 
             placement_rounds.append({
                 "place": place,
-                "winner": winner,
+                "winner": entry,
                 "irv_rounds": irv_details,
             })
-
-            if isinstance(winner, list):
-                # Tie - add all tied competitors
-                final_ranking.append(list(winner))
-                for w in winner:
-                    remaining.discard(w)
-                place += len(winner)
-            else:
-                final_ranking.append(winner)
-                remaining.discard(winner)
-                place += 1
+            final_ranking.append(entry)
+            remaining &= ~_indices_mask(winners)
+            place += len(winners)
 
         return VotingResult(
             system_name=self.name,
@@ -84,133 +125,218 @@ class SequentialIRVSystem(VotingSystem):
             },
         )
 
-    def _count_votes(self, scoresheet: Scoresheet, among: set[str], choice: int = 1) -> dict[str, int]:
-        votes = {c: 0 for c in among}
-        assert choice <= len(among)
-
-        for judge in scoresheet.judges:
-            ranking = scoresheet.get_judge_ranking(judge)
-            found = 0
-            for comp in ranking:
-                if comp in among:
-                    found += 1
-                    if found == choice:
-                        votes[comp] += 1
-                        break
-
-        return votes
+    def _choice_tallies(
+        self,
+        scoresheet: Scoresheet,
+        among: int,
+        cache: dict[int, list[dict[int, int]]],
+    ) -> list[dict[int, int]]:
+        """Count votes at every preference level among a set of candidates.
+
+        among is a bitmask of competitor indices. Returns a list where entry
+        n-1 maps each candidate to the number of judges ranking them nth
+        among those candidates. All levels come from a single pass over the
+        distinct rankings, so probing successive preference levels costs
+        nothing extra. Results are memoized in cache, keyed by bitmask;
+        callers must not modify the returned dicts.
+        """
+        tallies = cache.get(among)
+        if tallies is None:
+            candidates = _mask_indices(among)
+            num_levels = len(candidates)
+            tallies = [{c: 0 for c in candidates} for _ in candidates]
+            for ranking, count in scoresheet.distinct_rankings:
+                level = 0
+                for idx in ranking:
+                    if among >> idx & 1:
+                        tallies[level][idx] += count
+                        level += 1
+                        if level == num_levels:
+                            break
+            cache[among] = tallies
+        return tallies
+
+    def _count_first_choices(
+        self, scoresheet: Scoresheet, active: int,
+    ) -> tuple[dict[int, int], list[int], dict[int, list[int]]]:
+        """Count each judge's top choice among active candidates.
+
+        active is a bitmask of competitor indices. Identical rankings are
+        counted together, as listed in scoresheet.distinct_rankings. Returns
+        (votes, top_pos, backers), where top_pos[r] is the position in
+        distinct ranking r of its top active choice, and backers maps each
+        candidate to the distinct rankings whose top choice they are, for
+        use with _transfer_votes. Stops scanning each ranking at its first
+        active candidate, so unlike _choice_tallies this doesn't count any
+        deeper preference levels.
+        """
+        votes = {c: 0 for c in _mask_indices(active)}
+        backers: dict[int, list[int]] = {c: [] for c in votes}
+        top_pos = []
+
+        for r, (ranking, count) in enumerate(scoresheet.distinct_rankings):
+            pos = 0
+            while not active >> ranking[pos] & 1:
+                pos += 1
+            top_pos.append(pos)
+            votes[ranking[pos]] += count
+            backers[ranking[pos]].append(r)
+
+        return votes, top_pos, backers
+
+    def _transfer_votes(
+        self,
+        scoresheet: Scoresheet,
+        active: int,
+        eliminated: int,
+        votes: dict[int, int],
+        top_pos: list[int],
+        backers: dict[int, list[int]],
+    ) -> None:
+        """Move an eliminated candidate's votes to each ranking's next choice.
+
+        active must already exclude the eliminated candidate. Only the
+        eliminated candidate's backers are rescanned, and only from where
+        they left off; votes, top_pos and backers are updated in place.
+        """
+        del votes[eliminated]
+        rankings = scoresheet.distinct_rankings
+        for r in backers.pop(eliminated):
+            ranking, count = rankings[r]
+            pos = top_pos[r] + 1
+            while not active >> ranking[pos] & 1:
+                pos += 1
+            top_pos[r] = pos
+            choice = ranking[pos]
+            votes[choice] += count
+            backers[choice].append(r)
 
     def _run_irv(
-        self, candidates: set[str], scoresheet: Scoresheet,
-    ) -> tuple[str | list[str], list[dict]]:
-        """Run IRV to find a single winner among candidates.
-
-        Returns (winner, list of round details).
-        Winner may be a list if there's an unresolvable tie.
+        self,
+        active: int,
+        scoresheet: Scoresheet,
+        tally_cache: dict[int, list[dict[int, int]]],
+        tiebreak_cache: dict[int, tuple[int, dict]],
+        rng: random.Random,
+    ) -> tuple[list[int], list[dict]]:
+        """Run IRV to find a single winner among the active candidates.
+
+        active is a bitmask of competitor indices. Returns (winners, list of round
+        details), where the round details refer to competitors by name.
+        winners holds a single index unless there's an unresolvable tie.
         """
-        active = set(candidates)
+        competitors = scoresheet.competitors
         m = scoresheet.num_judges
         majority_threshold = m // 2 + 1
         round_details = []
-        excluded_zero_vote: list[str] = []
+
+        # Count first-choice votes among active candidates once, then update
+        # the tally as candidates are eliminated. The keys of
+        # first_place_votes and backers are kept in step with the active
+        # bitmask.
+        first_place_votes, top_pos, backers = self._count_first_choices(
+            scoresheet, active,
+        )
 
         round_num = 0
-        while len(active) > 1:
+        while active & (active - 1):  # more than one bit set
             round_num += 1
 
-            # Count first-choice votes among active candidates
-            first_place_votes = self._count_votes(scoresheet, active)
-
-            # In round 1, exclude candidates with zero first-choice votes.
-            # They would be eliminated one-by-one without affecting vote
-            # counts, so removing them all at once is equivalent.
-            if round_num == 1:
-                zero_vote = [c for c in active if first_place_votes[c] == 0]
-                if zero_vote and len(zero_vote) < len(active):
-                    excluded_zero_vote = sorted(zero_vote)
-                    for c in zero_vote:
-                        active.discard(c)
-                        del first_place_votes[c]
-
-                    # If only one remains after excluding zero-vote, they win
-                    if len(active) == 1:
-                        winner = list(active)[0]
-                        round_info = {
-                            "round": round_num,
-                            "active_candidates": list(active),
-                            "votes": dict(first_place_votes),
-                            "majority_needed": majority_threshold,
-                            "excluded_zero_vote": excluded_zero_vote,
-                            "winner": winner,
-                            "method": "majority",
-                        }
-                        round_details.append(round_info)
-                        return winner, round_details
-
+            # Exclude candidates with zero first-choice votes. They would be
+            # eliminated one-by-one without affecting vote counts, so
+            # removing them all at once is equivalent. (In practice this only
+            # fires in round 1: eliminations only ever add votes to the
+            # candidates that remain.)
+            zero_vote = [c for c, v in first_place_votes.items() if v == 0]
+            excluded_zero_vote: list[str] = []
+            if zero_vote and len(zero_vote) < len(first_place_votes):
+                excluded_zero_vote = sorted(competitors[c] for c in zero_vote)
+                for c in zero_vote:
+                    active &= ~(1 << c)
+                    del first_place_votes[c]
+                    del backers[c]
+
+            # Snapshot the tally by name (first_place_votes keeps changing),
+            # and reuse its keys for the candidate list
+            named_votes = _by_name(first_place_votes, competitors)
             round_info = {
                 "round": round_num,
-                "active_candidates": list(active),
-                "votes": dict(first_place_votes),
+                "active_candidates": list(named_votes),
+                "votes": named_votes,
                 "majority_needed": majority_threshold,
             }
 
-            if round_num == 1 and excluded_zero_vote:
+            if excluded_zero_vote:
                 round_info["excluded_zero_vote"] = excluded_zero_vote
 
-            # Check for majority winner
-            for comp in active:
-                if first_place_votes[comp] >= majority_threshold:
-                    round_info["winner"] = comp
-                    round_info["method"] = "majority"
-                    round_details.append(round_info)
-                    return comp, round_details
+            # Check for majority winner. At most one candidate can hold a
+            # majority, so only the front-runner needs checking.
+            top = max(first_place_votes, key=first_place_votes.__getitem__)
+            if first_place_votes[top] >= majority_threshold:
+                round_info["winner"] = competitors[top]
+                round_info["method"] = "majority"
+                round_details.append(round_info)
+                return [top], round_details
 
             # No majority - find candidate(s) to eliminate
-            min_votes = min(first_place_votes.values())
-            to_eliminate = [c for c in active if first_place_votes[c] == min_votes]
-
-            if len(to_eliminate) == len(active):
-                # Everyone tied - look at second-choice votes, and so on.
-                for choice in range(2, len(active)):
-                    nth_place_votes = self._count_votes(scoresheet, active, choice)
-                    min_nth_place_votes = min(nth_place_votes.values())
-                    nth_place_fewest = [c for c in active if nth_place_votes[c] == min_nth_place_votes]
-                    if len(nth_place_fewest) < len(active):
+            num_active = len(first_place_votes)
+            to_eliminate = _fewest_votes(first_place_votes)
+
+            if len(to_eliminate) == num_active:
+                # Everyone tied - look at second-choice votes, and so on. With
+                # only two candidates left there's nothing deeper to look at
+                # (each judge's second choice is just the other candidate),
+                # so the loop doesn't run and no tallies are computed.
+                for choice in range(2, num_active):
+                    tallies = self._choice_tallies(scoresheet, active, tally_cache)
+                    nth_place_votes = tallies[choice - 1]
+                    nth_place_fewest = _fewest_votes(nth_place_votes)
+                    if len(nth_place_fewest) < num_active:
                         to_eliminate = nth_place_fewest
                         round_info["tiebreak_choice"] = choice
-                        round_info["tiebreak_choice_votes"] = dict(nth_place_votes)
+                        round_info["tiebreak_choice_votes"] = _by_name(
+                            nth_place_votes, competitors
+                        )
                         break
 
                 else:
                     # Perfect tie - declare all equal
                     round_info["all_tied"] = True
-                    round_info["winner"] = list(active)
+                    round_info["winner"] = [competitors[c] for c in first_place_votes]
                     round_info["method"] = "all_tied_equal"
                     round_details.append(round_info)
-                    return list(active), round_details
+                    return list(first_place_votes), round_details
 
             # Break elimination tie if needed
             if len(to_eliminate) > 1:
                 eliminated, tiebreak_info = self._elimination_tiebreak(
-                    to_eliminate, scoresheet
+                    to_eliminate, scoresheet, tally_cache, tiebreak_cache, rng,
                 )
                 round_info["tiebreak"] = tiebreak_info
             else:
                 eliminated = to_eliminate[0]
 
-            round_info["eliminated"] = eliminated
+            round_info["eliminated"] = competitors[eliminated]
             round_info["method"] = "elimination"
             round_details.append(round_info)
 
-            active.remove(eliminated)
+            active &= ~(1 << eliminated)
+            self._transfer_votes(
+                scoresheet, active, eliminated, first_place_votes, top_pos,
+                backers,
+            )
 
         # One candidate remaining
-        winner = list(active)[0]
-        return winner, round_details
+        return [active.bit_length() - 1], round_details
 
     def _elimination_tiebreak(
-        self, tied: list[str], scoresheet: Scoresheet,
-    ) -> tuple[str, dict]:
+        self,
+        tied: list[int],
+        scoresheet: Scoresheet,
+        tally_cache: dict[int, list[dict[int, int]]],
+        tiebreak_cache: dict[int, tuple[int, dict]],
+        rng: random.Random,
+    ) -> tuple[int, dict]:
         """Determine who to eliminate when multiple have same lowest vote count.
 
         Tiebreak procedure: count first-choice votes restricted to only the
@@ -219,22 +345,36 @@ class SequentialIRVSystem(VotingSystem):
         equal at first-choice, try second-choice, third-choice, etc. before
         falling back to random.
 
+        The outcome depends only on the tied set, so results that didn't
+        need the random fallback are memoized in tiebreak_cache and reused
+        when the same set ties again in a later round or placement.
+
         Returns (candidate_to_eliminate, tiebreak_details).
         """
+        tied_mask = _indices_mask(tied)
+        if tied_mask in tiebreak_cache:
+            return tiebreak_cache[tied_mask]
+
+        competitors = scoresheet.competitors
         tiebreak_info = {
             "type": "elimination",
-            "tied_candidates": list(tied),
+            "tied_candidates": [competitors[c] for c in tied],
             "steps": [],
         }
 
         while len(tied) > 1:
             narrowed = False
+            among = _indices_mask(tied)
+            tallies = self._choice_tallies(scoresheet, among, tally_cache)
             for choice in range(1, len(tied) + 1):
-                votes = self._count_votes(scoresheet, set(tied), choice)
-                min_votes = min(votes.values())
-                fewest = [c for c in tied if votes[c] == min_votes]
+                votes = tallies[choice - 1]
+                fewest = _fewest_votes(votes)
 
-                step = {"method": "restricted_vote", "votes": dict(votes), "preference": choice}
+                step = {
+                    "method": "restricted_vote",
+                    "votes": _by_name(votes, competitors),
+                    "preference": choice,
+                }
 
                 if len(fewest) == len(tied):
                     # All equal at this preference level — try next
@@ -245,14 +385,15 @@ class SequentialIRVSystem(VotingSystem):
                 elif len(fewest) == 1:
                     # Resolved!
                     step["resolved"] = True
-                    step["eliminated"] = fewest[0]
+                    step["eliminated"] = competitors[fewest[0]]
                     tiebreak_info["steps"].append(step)
+                    tiebreak_cache[tied_mask] = (fewest[0], tiebreak_info)
                     return fewest[0], tiebreak_info
 
                 else:
                     # Narrowed but not fully resolved — restart outer loop from choice=1
                     step["resolved"] = False
-                    step["remaining_tied"] = list(fewest)
+                    step["remaining_tied"] = [competitors[c] for c in fewest]
                     tiebreak_info["steps"].append(step)
                     tied = fewest
                     narrowed = True
@@ -263,11 +404,11 @@ class SequentialIRVSystem(VotingSystem):
                 break
 
         # Fallback: choose at random
-        eliminated = random.choice(tied)
+        eliminated = rng.choice(tied)
         step = {
             "method": "random",
-            "remaining_tied": list(tied),
-            "eliminated": eliminated,
+            "remaining_tied": [competitors[c] for c in tied],
+            "eliminated": competitors[eliminated],
         }
         tiebreak_info["steps"].append(step)
         return eliminated, tiebreak_info
@@ -14,6 +14,7 @@ Usage:
 import argparse
 import json
 import re
+from collections.abc import Callable, Iterable
 from io import BytesIO
 from pathlib import Path
 
@@ -37,6 +38,9 @@ def extract_pdf_data(pdf_bytes: bytes) -> list[dict]:
                 "text": text,
                 "tables": tables,
             })
+            # Drop pdfplumber's cached layout objects for this page, so
+            # memory doesn't grow with the length of the document
+            page.close()
     return pages_data
 
 
@@ -45,10 +49,10 @@ def is_judge_initials(s: str) -> bool:
     return 2 <= len(s) <= 4 and s.isalnum()
 
 
-def extract_judge_key(text: str) -> dict[str, str]:
-    """Extract judge initials -> full name mapping from text."""
+def extract_judge_key(lines: Iterable[str]) -> dict[str, str]:
+    """Extract judge initials -> full name mapping from lines of text."""
     judge_key = {}
-    for line in text.split("\n"):
+    for line in lines:
         words = line.strip().split()
         if len(words) < 3:
             continue
@@ -120,8 +124,8 @@ def discover_names(pages_data: list[dict]) -> tuple[dict[str, str], list[str]]:
     {initials: full_name} and competitor_names is a list of raw name strings
     from the tables.
     """
-    all_text = "\n".join(page["text"] for page in pages_data)
-    judge_key = extract_judge_key(all_text)
+    judge_key = extract_judge_key(
+        line for page in pages_data for line in page["text"].split("\n"))
     competitor_names = extract_competitor_names(pages_data)
     return judge_key, competitor_names
 
@@ -181,6 +185,7 @@ def generate_fake_judge_names(judge_key: dict[str, str], fake: Faker
     name_mapping: dict[str, str] = {}
     initials_mapping: dict[str, str] = {}
     all_real = set(judge_key.values())
+    used_fakes: set[str] = set()
     used_initials: set[str] = set()
 
     for old_initials in sorted(judge_key.keys()):
@@ -190,9 +195,10 @@ def generate_fake_judge_names(judge_key: dict[str, str], fake: Faker
             fake_name = name_mapping[real_name]
         else:
             fake_name = _simple_fake_name(fake)
-            while fake_name in all_real or fake_name in name_mapping.values():
+            while fake_name in all_real or fake_name in used_fakes:
                 fake_name = _simple_fake_name(fake)
             name_mapping[real_name] = fake_name
+            used_fakes.add(fake_name)
 
         new_initials = _unique_initials(fake_name, used_initials)
         used_initials.add(new_initials)
@@ -208,76 +214,83 @@ def generate_fake_competitor_names(competitor_names: list[str], fake: Faker
     Competitor names may contain newlines (leader\\nfollower format).
     Each individual person gets a unique fake name.
     """
-    # Split compound names into individual people
-    person_names: set[str] = set()
-    for name in competitor_names:
-        # Names may be "Leader\\nFollower" or just "Leader & Follower"
-        parts = re.split(r"\n", name)
-        for part in parts:
-            part = part.strip()
-            if part:
-                person_names.add(part)
+    # Split each distinct compound name into individual people, once.
+    # Names may be "Leader\\nFollower" or just "Leader & Follower".
+    parts_by_name = {
+        name: [part.strip() for part in name.split("\n")]
+        for name in dict.fromkeys(competitor_names)
+    }
+    person_names: set[str] = {
+        part for parts in parts_by_name.values() for part in parts if part
+    }
 
     person_mapping: dict[str, str] = {}
+    used_fakes: set[str] = set()
     for person in sorted(person_names):
         fake_name = fake.name()
-        while fake_name in person_names or fake_name in person_mapping.values():
+        while fake_name in person_names or fake_name in used_fakes:
             fake_name = fake.name()
         person_mapping[person] = fake_name
+        used_fakes.add(fake_name)
 
     # Build full mapping for compound names
     mapping: dict[str, str] = {}
     mapping.update(person_mapping)
-    for name in competitor_names:
+    for name, parts in parts_by_name.items():
         if name not in mapping:
-            parts = re.split(r"\n", name)
-            fake_parts = [person_mapping.get(p.strip(), p.strip())
-                          for p in parts]
+            fake_parts = [person_mapping.get(p, p) for p in parts]
             mapping[name] = "\n".join(fake_parts)
 
     return mapping
 
 
+def _replacer(mapping: dict[str, str], whole_words: bool = False
+              ) -> Callable[[str], str]:
+    """Return a function that replaces all keys of mapping in one pass.
+
+    Where keys overlap at the same position, the longest one wins. If
+    whole_words is true, keys only match where not adjoined by word
+    characters. Strings shorter than the shortest key, like most score
+    cells, are returned without running the regex.
+    """
+    if not mapping:
+        return lambda s: s
+    keys = sorted(mapping, key=len, reverse=True)
+    shortest = len(keys[-1])
+    pattern = "|".join(re.escape(k) for k in keys)
+    if whole_words:
+        pattern = r"(?<!\w)(?:" + pattern + r")(?!\w)"
+    compiled = re.compile(pattern)
+
+    def replace(s: str) -> str:
+        if len(s) < shortest:
+            return s
+        return compiled.sub(lambda m: mapping[m.group(0)], s)
+
+    return replace
+
+
 def apply_replacements(pages_data: list[dict],
-                       judge_key: dict[str, str],
                        judge_mapping: dict[str, str],
                        competitor_mapping: dict[str, str],
                        initials_mapping: dict[str, str]) -> list[dict]:
     """Apply name and initials replacements to the extracted PDF data."""
-    # Build combined name mapping, longest first
+    # Build combined name mapping, replaced longest first in a single pass
     all_name_mappings: dict[str, str] = {}
     all_name_mappings.update(judge_mapping)
     all_name_mappings.update(competitor_mapping)
+    replace_names = _replacer(all_name_mappings)
 
-    sorted_name_replacements = sorted(all_name_mappings.items(),
-                                      key=lambda x: len(x[0]), reverse=True)
-
-    # Build text-level initials replacements: "OLD_INIT FAKE_NAME" -> "NEW_INIT FAKE_NAME"
-    # After name replacement, judge key lines become "OLD_INIT FAKE_NAME".
-    initials_text_replacements: list[tuple[str, str]] = []
-    for old_init, real_name in judge_key.items():
-        fake_name = judge_mapping[real_name]
-        new_init = initials_mapping[old_init]
-        initials_text_replacements.append(
-            (f"{old_init} {fake_name}", f"{new_init} {fake_name}")
-        )
+    # Old initials are replaced as standalone words in a single pass, both
+    # in judge key lines ("AG Marlis West" -> "MW Marlis West" after name
+    # replacement) and in header lines ("# Name AG RB CM ..."). A single pass
+    # matters: one judge's new initials may be another judge's old ones.
+    replace_initials = _replacer(initials_mapping, whole_words=True)
 
     result = []
     for page in pages_data:
-        # Replace names in text
-        text = page["text"]
-        for original, replacement in sorted_name_replacements:
-            text = text.replace(original, replacement)
-
-        # Replace initials in judge key lines (e.g., "AG Marlis West" -> "MW Marlis West")
-        for old_text, new_text in initials_text_replacements:
-            text = text.replace(old_text, new_text)
-
-        # Replace remaining old initials as standalone words in text
-        # (e.g., in the header line "# Name AG RB CM ...")
-        for old_init, new_init in initials_mapping.items():
-            text = re.sub(r'(?<!\w)' + re.escape(old_init) + r'(?!\w)',
-                          new_init, text)
+        # Replace names, then initials, in text
+        text = replace_initials(replace_names(page["text"]))
 
         # Replace in tables
         new_tables = []
@@ -289,10 +302,8 @@ def apply_replacements(pages_data: list[dict],
                     if cell is None:
                         new_row.append(None)
                     else:
-                        cell_str = str(cell)
                         # Replace names
-                        for original, replacement in sorted_name_replacements:
-                            cell_str = cell_str.replace(original, replacement)
+                        cell_str = replace_names(str(cell))
                         # Replace initials in header cells (exact match only)
                         if row_idx == 0 and cell_str.strip() in initials_mapping:
                             cell_str = initials_mapping[cell_str.strip()]
@@ -308,6 +319,23 @@ def apply_replacements(pages_data: list[dict],
     return result
 
 
+def find_remaining_names(pages_data: list[dict], names: set[str]) -> set[str]:
+    """Find which of the given names still appear in page text or tables."""
+    if not names:
+        return set()
+    pattern = re.compile("|".join(
+        re.escape(n) for n in sorted(names, key=len, reverse=True)))
+    remaining: set[str] = set()
+    for page in pages_data:
+        remaining.update(pattern.findall(page["text"]))
+        for table in page["tables"]:
+            for row in table:
+                for cell in row:
+                    if cell is not None:
+                        remaining.update(pattern.findall(cell))
+    return remaining
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Anonymize danceconvention.net example PDF")
@@ -344,26 +372,21 @@ def main():
         if "\n" not in original:
             print(f"  {original} -> {replacement}")
 
-    result = apply_replacements(pages_data, judge_key, judge_mapping,
-                                competitor_mapping, initials_mapping)
+    result = apply_replacements(pages_data, judge_mapping, competitor_mapping,
+                                initials_mapping)
 
-    # Verify no original names remain in text
+    # Verify no original names remain in text or tables
     all_originals = set(judge_mapping.keys()) | set(competitor_mapping.keys())
-    remaining = []
-    for page in result:
-        for name in all_originals:
-            if name in page["text"]:
-                remaining.append(name)
+    remaining = find_remaining_names(result, all_originals)
     if remaining:
-        print(f"WARNING: {len(remaining)} names still found in text: "
-              f"{set(remaining)}")
+        print(f"WARNING: {len(remaining)} names still found: {remaining}")
     else:
         print("All names successfully replaced.")
 
     output_path = Path(args.output)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(json.dumps(result, ensure_ascii=False, indent=2),
-                           encoding="utf-8")
+    with output_path.open("w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
     print(f"Written to {output_path}")
 
 
@@ -10,6 +10,8 @@ Usage:
 """
 
 import argparse
+import re
+from collections.abc import Callable
 from pathlib import Path
 
 from bs4 import BeautifulSoup
@@ -89,14 +91,14 @@ def generate_fake_names(names: set[str], seed: int) -> dict[str, str]:
     fake = Faker(["en_US", "en_GB", "de_DE", "fr_FR"])
     Faker.seed(seed)
 
-    # First, collect all individual person names
+    # First, collect all individual person names, splitting each name once
     person_names: set[str] = set()
-    compound_names: set[str] = set()
+    compound_parts: dict[str, list[str]] = {}
 
     for name in names:
         parts = split_competitor_name(name)
         if len(parts) > 1:
-            compound_names.add(name)
+            compound_parts[name] = parts
             for part in parts:
                 person_names.add(part)
         else:
@@ -104,54 +106,73 @@ def generate_fake_names(names: set[str], seed: int) -> dict[str, str]:
 
     # Generate fake names for each individual person
     person_mapping: dict[str, str] = {}
-    used_fakes: set[str] = set()
 
     # Group by case-insensitive key to give same fake name
     # to different case variants (e.g., "JANE DOE" and "Jane Doe")
     lower_to_canonical: dict[str, str] = {}
+    case_variants: dict[str, list[str]] = {}
     for name in sorted(person_names):
         lower = name.lower()
         if lower not in lower_to_canonical:
             lower_to_canonical[lower] = name
+            case_variants[lower] = []
+        case_variants[lower].append(name)
+
+    # Lowercased names to avoid, for case-insensitive collision checks
+    taken_lower = set(lower_to_canonical)
 
     for lower_name in sorted(lower_to_canonical.keys()):
         canonical = lower_to_canonical[lower_name]
         fake_name = fake.name()
-        while fake_name.lower() in {n.lower() for n in person_names} or \
-                fake_name.lower() in {n.lower() for n in used_fakes}:
+        while fake_name.lower() in taken_lower:
             fake_name = fake.name()
-        used_fakes.add(fake_name)
+        taken_lower.add(fake_name.lower())
 
         # Map all case variants of this person
-        for name in sorted(person_names):
-            if name.lower() == lower_name:
-                if name.isupper():
-                    person_mapping[name] = fake_name.upper()
-                else:
-                    person_mapping[name] = fake_name
+        for name in case_variants[lower_name]:
+            if name.isupper():
+                person_mapping[name] = fake_name.upper()
+            else:
+                person_mapping[name] = fake_name
 
     # Build the full mapping: individual names + compound names
     mapping: dict[str, str] = {}
     mapping.update(person_mapping)
 
-    for compound in compound_names:
-        parts = split_competitor_name(compound)
+    for compound, parts in compound_parts.items():
         fake_parts = [person_mapping.get(p, p) for p in parts]
         mapping[compound] = " and ".join(fake_parts)
 
     return mapping
 
 
+def _replacer(mapping: dict[str, str]) -> Callable[[str], str]:
+    """Return a function that replaces all keys of mapping in one pass.
+
+    Where keys overlap at the same position, the longest one wins.
+    """
+    if not mapping:
+        return lambda s: s
+    pattern = re.compile("|".join(
+        re.escape(k) for k in sorted(mapping, key=len, reverse=True)))
+    return lambda s: pattern.sub(lambda m: mapping[m.group(0)], s)
+
+
 def apply_replacements(html: str, mapping: dict[str, str]) -> str:
-    """Apply all replacements to the HTML string.
+    """Apply all replacements to the HTML string in a single pass.
 
-    Replaces longer strings first to avoid partial matches.
+    Longer strings take precedence to avoid partial matches.
     """
-    for original in sorted(mapping, key=len, reverse=True):
-        replacement = mapping[original]
-        html = html.replace(original, replacement)
+    return _replacer(mapping)(html)
+
 
-    return html
+def find_remaining_names(html: str, names: set[str]) -> set[str]:
+    """Find which of the given names still appear in the HTML."""
+    if not names:
+        return set()
+    pattern = re.compile("|".join(
+        re.escape(n) for n in sorted(names, key=len, reverse=True)))
+    return set(pattern.findall(html))
 
 
 def main():
@@ -175,10 +196,7 @@ def main():
     result = apply_replacements(html, mapping)
 
     # Verify no original names remain
-    remaining = []
-    for name in names:
-        if name in result:
-            remaining.append(name)
+    remaining = find_remaining_names(result, names)
     if remaining:
         print(f"WARNING: {len(remaining)} names still found: {remaining}")
     else:
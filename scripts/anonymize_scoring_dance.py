@@ -9,32 +9,60 @@ Usage:
     python scripts/anonymize_scoring_dance.py examples/scoring.dance-example.html -o output.html
 """
 
+from __future__ import annotations
+
 import argparse
 import json
 import re
+from collections.abc import Callable
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from bs4 import BeautifulSoup
-from faker import Faker
+# bs4 and faker are imported where they're used, so that --help and
+# argument errors don't pay for loading them
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
 
 FIXTURES_DIR = Path(__file__).parent.parent / "tests" / "test_parsers" / "fixtures"
 DEFAULT_OUTPUT = FIXTURES_DIR / "scoring-dance.html"
 
 SEED = 20260101
 
+CHIEF_JUDGE_SUFFIX = "(Chiefjudge)"
+
+
+def _strip_chief_judge(title: str) -> str:
+    """Remove a trailing "(Chiefjudge)" and the whitespace around it."""
+    stripped = title.rstrip()
+    if stripped.endswith(CHIEF_JUDGE_SUFFIX):
+        return stripped[:-len(CHIEF_JUDGE_SUFFIX)].rstrip()
+    return title
 
-def discover_names(html: str) -> tuple[set[str], set[str]]:
-    """Discover all personal names and WSDC IDs in the HTML.
+
+def discover_names(soup: BeautifulSoup) -> tuple[set[str], set[str]]:
+    """Discover all personal names and WSDC IDs in the parsed HTML.
 
     Returns (names, wsdc_ids) where names is a set of name strings and
     wsdc_ids is a set of numeric ID strings.
     """
-    soup = BeautifulSoup(html, "lxml")
+    from bs4 import Tag
+
     names: set[str] = set()
     wsdc_ids: set[str] = set()
 
+    # Find JSON-LD blocks and TITLE attributes in a single walk of the tree
+    json_ld_scripts: list[Tag] = []
+    titles: list[str] = []
+    for tag in soup.descendants:
+        if not isinstance(tag, Tag):
+            continue
+        if tag.name == "script" and tag.get("type") == "application/ld+json":
+            json_ld_scripts.append(tag)
+        if tag.has_attr("title"):
+            titles.append(tag["title"])
+
     # Parse JSON-LD blocks for names
-    for script in soup.find_all("script", {"type": "application/ld+json"}):
+    for script in json_ld_scripts:
         try:
             data = json.loads(script.string)
         except (json.JSONDecodeError, TypeError):
@@ -62,11 +90,11 @@ def discover_names(html: str) -> tuple[set[str], set[str]]:
                     wsdc_ids.add(str(wsdc_id))
 
     # Also find names in TITLE attributes (catches chief judge etc.)
-    for elem in soup.find_all(attrs={"title": True}):
-        title = elem["title"].strip()
+    for title in titles:
+        title = title.strip()
         if title:
             # Remove "(Chiefjudge)" suffix if present
-            cleaned = re.sub(r"\s*\(Chiefjudge\)\s*$", "", title)
+            cleaned = _strip_chief_judge(title)
             if cleaned and not cleaned.isdigit():
                 names.add(cleaned)
 
@@ -75,22 +103,28 @@ def discover_names(html: str) -> tuple[set[str], set[str]]:
 
 def generate_fake_names(names: set[str], seed: int) -> dict[str, str]:
     """Generate a mapping of real names to fake names."""
+    from faker import Faker
+
     fake = Faker(["en_US", "en_GB", "de_DE", "fr_FR"])
     Faker.seed(seed)
 
     mapping: dict[str, str] = {}
+    used: set[str] = set()
     for name in sorted(names):  # Sort for determinism
         fake_name = fake.name()
         # Ensure no collisions with existing names or other fakes
-        while fake_name in names or fake_name in mapping.values():
+        while fake_name in names or fake_name in used:
             fake_name = fake.name()
         mapping[name] = fake_name
+        used.add(fake_name)
 
     return mapping
 
 
 def generate_fake_wsdc_ids(wsdc_ids: set[str], seed: int) -> dict[str, str]:
     """Generate a mapping of real WSDC IDs to fake ones."""
+    from faker import Faker
+
     fake = Faker()
     Faker.seed(seed + 1000)  # Different seed from names
 
@@ -112,8 +146,7 @@ def _derive_initials(name: str) -> str:
     For names with hyphens, takes first letter of each hyphenated part.
     E.g. "Tyler Garcia" -> "TG", "Agathe-Luce Potier" -> "ALP".
     """
-    parts = re.split(r"[\s-]+", name)
-    return "".join(p[0] for p in parts if p)
+    return "".join(p[0] for p in name.replace("-", " ").split())
 
 
 def _unique_initials(name: str, used: set[str]) -> str:
@@ -137,14 +170,15 @@ def _unique_initials(name: str, used: set[str]) -> str:
     return base
 
 
-def update_judge_initials(html: str, name_mapping: dict[str, str]) -> str:
+def update_judge_initials(html: str, soup: BeautifulSoup,
+                          name_mapping: dict[str, str]) -> str:
     """Update judge initials in <th> elements to match fake names.
 
-    Finds <th> elements with TITLE attributes containing judge names,
-    derives new initials from the fake name, and replaces the old initials.
+    Finds <th> elements in soup with TITLE attributes containing judge
+    names, derives new initials from each judge's fake name in
+    name_mapping, and replaces the old initials in html. soup is the parse
+    of the original HTML, so it can be shared with discover_names.
     """
-    soup = BeautifulSoup(html, "lxml")
-
     # Collect all judge <th> elements (those with TITLE and short text content)
     judge_ths = []
     for th in soup.find_all("th"):
@@ -152,7 +186,7 @@ def update_judge_initials(html: str, name_mapping: dict[str, str]) -> str:
         if not title:
             continue
         # Clean the title (remove "(Chiefjudge)" suffix)
-        cleaned_title = re.sub(r"\s*\(Chiefjudge\)\s*$", "", title)
+        cleaned_title = _strip_chief_judge(title)
         if not cleaned_title:
             continue
         # Only header cells with short text (initials), not data cells with numbers
@@ -176,7 +210,8 @@ def update_judge_initials(html: str, name_mapping: dict[str, str]) -> str:
     used_initials: set[str] = set()
     initials_mapping: dict[str, str] = {}  # old_initials -> new_initials
     for title, old_initials in unique_judge_ths:
-        new_initials = _unique_initials(title, used_initials)
+        fake_name = name_mapping.get(title, title)
+        new_initials = _unique_initials(fake_name, used_initials)
         used_initials.add(new_initials)
         initials_mapping[old_initials] = new_initials
 
@@ -190,40 +225,69 @@ def update_judge_initials(html: str, name_mapping: dict[str, str]) -> str:
     return html
 
 
-def apply_replacements(html: str, name_mapping: dict[str, str],
+def _json_escapes(s: str) -> bool:
+    """Return whether json.dumps would escape any character of s."""
+    return not (s.isascii() and s.isprintable()) or '"' in s or "\\" in s
+
+
+def _replacer(mapping: dict[str, str]) -> Callable[[str], str]:
+    """Return a function that replaces all keys of mapping in one pass.
+
+    Where keys overlap at the same position, the longest one wins.
+    """
+    if not mapping:
+        return lambda s: s
+    pattern = re.compile("|".join(
+        re.escape(k) for k in sorted(mapping, key=len, reverse=True)))
+    return lambda s: pattern.sub(lambda m: mapping[m.group(0)], s)
+
+
+def apply_replacements(html: str, soup: BeautifulSoup,
+                       name_mapping: dict[str, str],
                        wsdc_mapping: dict[str, str]) -> str:
     """Apply all replacements to the HTML string.
 
-    Replaces longer strings first to avoid partial matches.
+    Replaces longer strings first to avoid partial matches. soup is the
+    parse of the original HTML, used to find judge initials.
     """
-    # Replace names (longest first to avoid partial matches)
-    for original in sorted(name_mapping, key=len, reverse=True):
-        replacement = name_mapping[original]
-        html = html.replace(original, replacement)
-        # Also handle JSON-escaped versions (for unicode chars like \u00e1)
-        json_original = json.dumps(original)[1:-1]  # Strip quotes
-        json_replacement = json.dumps(replacement)[1:-1]
-        if json_original != original:
-            html = html.replace(json_original, json_replacement)
-
-    # Replace WSDC IDs in known contexts to avoid false positives
-    for original_id, fake_id in sorted(wsdc_mapping.items()):
-        # In JSON: "id":"12345" or "id": "12345"
-        html = html.replace(f'"id":"{original_id}"', f'"id":"{fake_id}"')
-        html = html.replace(f'"id": "{original_id}"', f'"id": "{fake_id}"')
-        # In URLs: /registry/12345.html
-        html = html.replace(f"registry/{original_id}.html",
-                            f"registry/{fake_id}.html")
-        # In data attributes: data-wsdc="12345"
-        html = html.replace(f'data-wsdc="{original_id}"',
-                            f'data-wsdc="{fake_id}"')
+    # Replace names in a single pass (longest first to avoid partial matches)
+    all_name_mappings: dict[str, str] = {}
+    for original, replacement in name_mapping.items():
+        all_name_mappings[original] = replacement
+        # Also handle JSON-escaped versions (for unicode chars like \u00e1).
+        # Printable ASCII other than quotes and backslashes encodes as
+        # itself, so only other names need encoding.
+        if _json_escapes(original):
+            json_original = json.dumps(original)[1:-1]  # Strip quotes
+            all_name_mappings[json_original] = json.dumps(replacement)[1:-1]
+    html = _replacer(all_name_mappings)(html)
+
+    # Replace WSDC IDs in a single pass, only in known contexts to avoid
+    # false positives: in JSON ("id":"12345" or "id": "12345"), in URLs
+    # (/registry/12345.html) and in data attributes (data-wsdc="12345")
+    if wsdc_mapping:
+        ids = "|".join(re.escape(i) for i in wsdc_mapping)
+        wsdc_re = re.compile(
+            rf'(?<="id":")(?:{ids})(?=")|(?<="id": ")(?:{ids})(?=")'
+            rf'|(?<=registry/)(?:{ids})(?=\.html)'
+            rf'|(?<=data-wsdc=")(?:{ids})(?=")')
+        html = wsdc_re.sub(lambda m: wsdc_mapping[m.group(0)], html)
 
     # Update judge initials to match fake names
-    html = update_judge_initials(html, name_mapping)
+    html = update_judge_initials(html, soup, name_mapping)
 
     return html
 
 
+def find_remaining_names(html: str, names: set[str]) -> set[str]:
+    """Find which of the given names still appear in the HTML."""
+    if not names:
+        return set()
+    pattern = re.compile("|".join(
+        re.escape(n) for n in sorted(names, key=len, reverse=True)))
+    return set(pattern.findall(html))
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Anonymize scoring.dance example HTML")
@@ -232,9 +296,12 @@ def main():
                         help=f"Output path (default: {DEFAULT_OUTPUT})")
     args = parser.parse_args()
 
+    from bs4 import BeautifulSoup
+
     html = Path(args.input).read_text(encoding="utf-8")
 
-    names, wsdc_ids = discover_names(html)
+    soup = BeautifulSoup(html, "lxml")
+    names, wsdc_ids = discover_names(soup)
     print(f"Found {len(names)} unique names and {len(wsdc_ids)} WSDC IDs")
 
     name_mapping = generate_fake_names(names, SEED)
@@ -243,13 +310,10 @@ def main():
     for original, fake in sorted(name_mapping.items()):
         print(f"  {original} -> {fake}")
 
-    result = apply_replacements(html, name_mapping, wsdc_mapping)
+    result = apply_replacements(html, soup, name_mapping, wsdc_mapping)
 
     # Verify no original names remain
-    remaining = []
-    for name in names:
-        if name in result:
-            remaining.append(name)
+    remaining = find_remaining_names(result, names)
     if remaining:
         print(f"WARNING: {len(remaining)} names still found: {remaining}")
     else:
@@ -4,6 +4,7 @@
 import argparse
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 from pathlib import Path
@@ -31,6 +32,9 @@ LEVEL_COLORS = {
 }
 ANSI_RESET = "\033[0m"
 
+# Number of scoresheets to download at once while analyzing
+FETCH_WORKERS = 4
+
 
 def colorize(text: str, level: str) -> str:
     if not sys.stdout.isatty():
@@ -470,26 +474,31 @@ def analyze_finals(
     finals: list[DiscoveredFinal], client: httpx.Client
 ) -> list[AnalyzedFinal]:
     analyzed = []
-    for i, final in enumerate(finals, 1):
-        div = final.division or "(single division)"
-        print(f"  [{i}/{len(finals)}] {final.event_name} — {div}", end=" ", flush=True)
-        try:
-            content = client.get(final.url).content
-            result = analyze_scoresheet(final.url, content, division=final.parser_division)
-            s = summarize(result)
-            analyzed.append(AnalyzedFinal(
-                final=final,
-                level=s["level"],
-                label=s["label"],
-                sentence=s["sentence"],
-                competition_name=result.scoresheet.competition_name,
-                analysis=result,
-            ))
-            print(f"→ {colorize(s['label'], s['level'])}")
-        except AnalysisError as e:
-            print(f"→ skip ({e})")
-        except Exception as e:
-            print(f"→ error: {e}")
+    # Downloading dominates the running time (the voting systems take about
+    # a millisecond per scoresheet), so fetch ahead in a small thread pool
+    # and analyze each scoresheet in order as its download completes.
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as pool:
+        downloads = [pool.submit(client.get, final.url) for final in finals]
+        for i, (final, download) in enumerate(zip(finals, downloads), 1):
+            div = final.division or "(single division)"
+            print(f"  [{i}/{len(finals)}] {final.event_name} — {div}", end=" ", flush=True)
+            try:
+                content = download.result().content
+                result = analyze_scoresheet(final.url, content, division=final.parser_division)
+                s = summarize(result)
+                analyzed.append(AnalyzedFinal(
+                    final=final,
+                    level=s["level"],
+                    label=s["label"],
+                    sentence=s["sentence"],
+                    competition_name=result.scoresheet.competition_name,
+                    analysis=result,
+                ))
+                print(f"→ {colorize(s['label'], s['level'])}")
+            except AnalysisError as e:
+                print(f"→ skip ({e})")
+            except Exception as e:
+                print(f"→ error: {e}")
     return analyzed
 
 
@@ -1,79 +1,61 @@
 """Tests for core data models."""
 
+import pytest
+
 from core.models import Placement
+from tests.conftest import make_scoresheet
 
 
 class TestBuildRanking:
-    def test_no_ties(self):
-        result = Placement.build_ranking(["A", "B", "C"])
-        assert [(p.name, p.rank, p.tied) for p in result] == [
+    @pytest.mark.parametrize("ordered, expected", [
+        pytest.param(["A", "B", "C"], [
             ("A", 1, False),
             ("B", 2, False),
             ("C", 3, False),
-        ]
-
-    def test_tie_in_middle(self):
-        result = Placement.build_ranking(["A", ["B", "C"], "D"])
-        assert [(p.name, p.rank, p.tied) for p in result] == [
+        ], id="no_ties"),
+        pytest.param(["A", ["B", "C"], "D"], [
             ("A", 1, False),
             ("B", 2, True),
             ("C", 2, True),
             ("D", 4, False),
-        ]
-
-    def test_tie_at_start(self):
-        result = Placement.build_ranking([["A", "B"], "C"])
-        assert [(p.name, p.rank, p.tied) for p in result] == [
+        ], id="tie_in_middle"),
+        pytest.param([["A", "B"], "C"], [
             ("A", 1, True),
             ("B", 1, True),
             ("C", 3, False),
-        ]
-
-    def test_tie_at_end(self):
-        result = Placement.build_ranking(["A", ["B", "C"]])
-        assert [(p.name, p.rank, p.tied) for p in result] == [
+        ], id="tie_at_start"),
+        pytest.param(["A", ["B", "C"]], [
             ("A", 1, False),
             ("B", 2, True),
             ("C", 2, True),
-        ]
-
-    def test_multiple_ties(self):
-        result = Placement.build_ranking([["A", "B"], "C", ["D", "E"]])
-        assert [(p.name, p.rank, p.tied) for p in result] == [
+        ], id="tie_at_end"),
+        pytest.param([["A", "B"], "C", ["D", "E"]], [
             ("A", 1, True),
             ("B", 1, True),
             ("C", 3, False),
             ("D", 4, True),
             ("E", 4, True),
-        ]
-
-    def test_three_way_tie(self):
-        result = Placement.build_ranking(["A", ["B", "C", "D"], "E"])
-        assert [(p.name, p.rank, p.tied) for p in result] == [
+        ], id="multiple_ties"),
+        pytest.param(["A", ["B", "C", "D"], "E"], [
             ("A", 1, False),
             ("B", 2, True),
             ("C", 2, True),
             ("D", 2, True),
             ("E", 5, False),
-        ]
-
-    def test_all_tied(self):
-        result = Placement.build_ranking([["A", "B", "C"]])
-        assert [(p.name, p.rank, p.tied) for p in result] == [
+        ], id="three_way_tie"),
+        pytest.param([["A", "B", "C"]], [
             ("A", 1, True),
             ("B", 1, True),
             ("C", 1, True),
-        ]
-
-    def test_single_competitor(self):
-        result = Placement.build_ranking(["A"])
-        assert [(p.name, p.rank, p.tied) for p in result] == [
+        ], id="all_tied"),
+        pytest.param(["A"], [
             ("A", 1, False),
-        ]
-
-    def test_empty(self):
-        result = Placement.build_ranking([])
-        assert result == []
+        ], id="single_competitor"),
+        pytest.param([], [], id="empty"),
+    ])
+    def test_build_ranking(self, ordered, expected):
+        result = Placement.build_ranking(ordered)
+        assert [(p.name, p.rank, p.tied) for p in result] == expected
 
     def test_to_dict(self):
         result = Placement.build_ranking(["A", ["B", "C"]])
@@ -82,3 +64,38 @@ class TestBuildRanking:
             {"name": "B", "rank": 2, "tied": True},
             {"name": "C", "rank": 2, "tied": True},
         ]
+
+
+class TestRankingIndices:
+    def test_matches_judge_rankings(self):
+        scoresheet = make_scoresheet("Indices", {
+            "J1": {"A": 2, "B": 3, "C": 1},
+            "J2": {"A": 1, "B": 2, "C": 3},
+        })
+        assert scoresheet.ranking_indices == [[2, 0, 1], [0, 1, 2]]
+        for judge, indices in zip(scoresheet.judges, scoresheet.ranking_indices):
+            assert [scoresheet.competitors[i] for i in indices] == \
+                scoresheet.get_judge_ranking(judge)
+
+    def test_cached(self):
+        scoresheet = make_scoresheet("Cached", {
+            "J1": {"A": 1, "B": 2},
+        })
+        assert scoresheet.ranking_indices is scoresheet.ranking_indices
+
+
+class TestDistinctRankings:
+    def test_groups_identical_rankings(self):
+        scoresheet = make_scoresheet("Distinct", {
+            "J1": {"A": 2, "B": 3, "C": 1},
+            "J2": {"A": 1, "B": 2, "C": 3},
+            "J3": {"A": 2, "B": 3, "C": 1},
+        })
+        assert scoresheet.distinct_rankings == [([2, 0, 1], 2), ([0, 1, 2], 1)]
+
+    def test_counts_cover_all_judges(self):
+        scoresheet = make_scoresheet("Distinct", {
+            "J1": {"A": 1, "B": 2},
+            "J2": {"A": 2, "B": 1},
+        })
+        assert sum(c for _, c in scoresheet.distinct_rankings) == scoresheet.num_judges
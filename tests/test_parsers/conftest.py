@@ -3,7 +3,6 @@
 import html as _html
 import json
 from pathlib import Path
-from unittest.mock import MagicMock
 
 import pytest
 
@@ -34,25 +33,52 @@ def make_eepro_html():
 
 
 # --- HTML fixtures (anonymized) ---
+#
+# Session-scoped: the files are read once and bytes can't be modified.
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def scoring_dance_html():
     path = FIXTURES_DIR / "scoring-dance.html"
     return path.read_bytes()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def eepro_html():
     path = FIXTURES_DIR / "eepro.html"
     return path.read_bytes()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def eepro_mixed_html():
     path = FIXTURES_DIR / "eepro-prelims-finals-same-page.html"
     return path.read_bytes()
 
 
+@pytest.fixture(scope="class")
+def eepro_advanced_result(eepro_html):
+    """The Advanced division of the eepro example, parsed once per test class.
+
+    Tests using this must not modify the returned Scoresheet.
+    """
+    from core.parsers.eepro import EeproParser
+
+    return EeproParser().parse(
+        "https://eepro.com/results/paris-swing-classic/novice-jnj.html",
+        eepro_html, division="Advanced")
+
+
+@pytest.fixture(scope="class")
+def scoring_dance_result(scoring_dance_html):
+    """The scoring.dance example, parsed once per test class.
+
+    Tests using this must not modify the returned Scoresheet.
+    """
+    from core.parsers.scoring_dance import ScoringDanceParser
+
+    return ScoringDanceParser().parse(
+        "https://scoring.dance/events/123/results/456.html", scoring_dance_html)
+
+
 # --- PDF fixtures ---
 
 @pytest.fixture
@@ -76,65 +102,100 @@ def danceconvention_ru_pdf():
     return path.read_bytes()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def pdf_bytes():
     """Trivial PDF-like bytes for cross-parser rejection tests."""
     return b"%PDF-1.4 fake"
 
 
 # --- JSON fixtures for danceconvention (anonymized extracted data) ---
+#
+# These are session-scoped so each file is read and parsed once. The parser
+# only reads the page data, so tests can safely share it. The fixtures that
+# patch pdfplumber.open with them keep narrower scopes.
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def danceconvention_json():
     """Anonymized extracted PDF data (English) as parsed page dicts."""
     path = FIXTURES_DIR / "danceconvention.json"
     return json.loads(path.read_text(encoding="utf-8"))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def danceconvention_ru_json():
     """Anonymized extracted PDF data (Russian) as parsed page dicts."""
     path = FIXTURES_DIR / "danceconvention-ru.json"
     return json.loads(path.read_text(encoding="utf-8"))
 
 
-def _make_mock_pdf(pages_data: list[dict]) -> MagicMock:
+class _MockPage:
+    """Stand-in for a pdfplumber page that returns canned text and tables."""
+
+    def __init__(self, text: str, tables: list):
+        self._text = text
+        self._tables = tables
+
+    def extract_text(self) -> str:
+        return self._text
+
+    def extract_tables(self) -> list:
+        return self._tables
+
+
+class _MockPDF:
+    """Stand-in for a pdfplumber PDF, usable as a context manager."""
+
+    def __init__(self, pages: list[_MockPage]):
+        self.pages = pages
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+def _make_mock_pdf(pages_data: list[dict]) -> _MockPDF:
     """Create a mock pdfplumber PDF object from extracted page data."""
-    mock_pages = []
-    for page_data in pages_data:
-        mock_page = MagicMock()
-        mock_page.extract_text.return_value = page_data["text"]
-        mock_page.extract_tables.return_value = page_data["tables"]
-        mock_pages.append(mock_page)
-
-    mock_pdf = MagicMock()
-    mock_pdf.pages = mock_pages
-    mock_pdf.__enter__ = MagicMock(return_value=mock_pdf)
-    mock_pdf.__exit__ = MagicMock(return_value=False)
-    return mock_pdf
+    return _MockPDF([_MockPage(page_data["text"], page_data["tables"])
+                     for page_data in pages_data])
 
 
-@pytest.fixture
-def mock_pdfplumber_en(danceconvention_json, monkeypatch):
-    """Monkeypatch pdfplumber.open to return anonymized English PDF data."""
+@pytest.fixture(scope="class")
+def danceconvention_en_result(danceconvention_json):
+    """The English example parsed once and shared by a test class.
+
+    Tests using this must not modify the returned Scoresheet.
+    """
     import pdfplumber
 
-    mock_pdf = _make_mock_pdf(danceconvention_json)
-    monkeypatch.setattr(pdfplumber, "open", lambda *args, **kwargs: mock_pdf)
-    return mock_pdf
+    from core.parsers.danceconvention import DanceConventionParser
 
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(pdfplumber, "open",
+                   lambda *args, **kwargs: _make_mock_pdf(danceconvention_json))
+        return DanceConventionParser().parse(
+            "https://danceconvention.net/eventdirector/en/roundscores/12345.pdf", b"%PDF")
 
-@pytest.fixture
-def mock_pdfplumber_ru(danceconvention_ru_json, monkeypatch):
-    """Monkeypatch pdfplumber.open to return anonymized Russian PDF data."""
+
+@pytest.fixture(scope="class")
+def danceconvention_ru_result(danceconvention_ru_json):
+    """The Russian example parsed once and shared by a test class.
+
+    Tests using this must not modify the returned Scoresheet.
+    """
     import pdfplumber
 
-    mock_pdf = _make_mock_pdf(danceconvention_ru_json)
-    monkeypatch.setattr(pdfplumber, "open", lambda *args, **kwargs: mock_pdf)
-    return mock_pdf
+    from core.parsers.danceconvention import DanceConventionParser
 
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(pdfplumber, "open",
+                   lambda *args, **kwargs: _make_mock_pdf(danceconvention_ru_json))
+        return DanceConventionParser().parse(
+            "https://danceconvention.net/eventdirector/ru/roundscores/12345.pdf", b"%PDF")
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def danceconvention_full_tie_json():
     path = FIXTURES_DIR / "danceconvention-full-tie.json"
     return json.loads(path.read_text(encoding="utf-8"))
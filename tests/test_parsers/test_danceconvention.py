@@ -60,42 +60,42 @@ class TestDanceConventionParser:
     def test_cannot_parse_content_eepro(self, eepro_html):
         assert not self.parser.can_parse_content(eepro_html, "results.html")
 
-    # --- parse (English, using mock pdfplumber) ---
+    # --- parse (English, using mock pdfplumber, parsed once per class) ---
 
-    def test_parse_competition_name(self, mock_pdfplumber_en):
-        result = self.parser.parse(self.VALID_URL, b"%PDF")
+    def test_parse_competition_name(self, danceconvention_en_result):
+        result = danceconvention_en_result
         assert "After Party" in result.competition_name or "Novice" in result.competition_name
 
-    def test_parse_competitor_count(self, mock_pdfplumber_en):
-        result = self.parser.parse(self.VALID_URL, b"%PDF")
+    def test_parse_competitor_count(self, danceconvention_en_result):
+        result = danceconvention_en_result
         assert result.num_competitors == 12
 
-    def test_parse_judge_count(self, mock_pdfplumber_en):
-        result = self.parser.parse(self.VALID_URL, b"%PDF")
+    def test_parse_judge_count(self, danceconvention_en_result):
+        result = danceconvention_en_result
         assert result.num_judges == 7
 
-    def test_parse_judges(self, mock_pdfplumber_en):
-        result = self.parser.parse(self.VALID_URL, b"%PDF")
+    def test_parse_judges(self, danceconvention_en_result):
+        result = danceconvention_en_result
         assert "Marlis West" in result.judges
         assert "Claire Newman" in result.judges
         assert "Zehra Martin" in result.judges
 
-    def test_parse_competitors(self, mock_pdfplumber_en):
-        result = self.parser.parse(self.VALID_URL, b"%PDF")
+    def test_parse_competitors(self, danceconvention_en_result):
+        result = danceconvention_en_result
         assert any("Hazel Cox" in c for c in result.competitors)
 
-    def test_parse_rankings_complete(self, mock_pdfplumber_en):
+    def test_parse_rankings_complete(self, danceconvention_en_result):
         """Every judge has a ranking for every competitor."""
-        result = self.parser.parse(self.VALID_URL, b"%PDF")
+        result = danceconvention_en_result
         for judge in result.judges:
             for competitor in result.competitors:
                 assert competitor in result.rankings[judge], (
                     f"Missing ranking: {judge} -> {competitor}"
                 )
 
-    def test_parse_rankings_valid_range(self, mock_pdfplumber_en):
+    def test_parse_rankings_valid_range(self, danceconvention_en_result):
         """All rankings are positive integers."""
-        result = self.parser.parse(self.VALID_URL, b"%PDF")
+        result = danceconvention_en_result
         for judge in result.judges:
             for competitor in result.competitors:
                 rank = result.rankings[judge][competitor]
@@ -103,24 +103,24 @@ class TestDanceConventionParser:
                     f"Rank not positive: {judge} -> {competitor} = {rank}"
                 )
 
-    def test_parse_spot_check_ranking(self, mock_pdfplumber_en):
+    def test_parse_spot_check_ranking(self, danceconvention_en_result):
         """Verify a specific known ranking."""
-        result = self.parser.parse(self.VALID_URL, b"%PDF")
+        result = danceconvention_en_result
         # Marlis West ranked Hazel Cox & Laura Lynn 3rd
         assert result.rankings["Marlis West"]["Hazel Cox & Laura Lynn"] == 3
 
-    def test_parse_includes_page_2_competitors(self, mock_pdfplumber_en):
+    def test_parse_includes_page_2_competitors(self, danceconvention_en_result):
         """The PDF has competitors spanning 2 pages. All must be parsed."""
-        result = self.parser.parse(self.VALID_URL, b"%PDF")
+        result = danceconvention_en_result
         # Émilie Perrot & Antonios Pieper are on page 2
         page_2_found = any("Perrot" in c or "Antonios" in c for c in result.competitors)
         assert page_2_found, (
             f"Page 2 competitor not found. Competitors: {result.competitors}"
         )
 
-    def test_parse_page_2_spot_check_ranking(self, mock_pdfplumber_en):
+    def test_parse_page_2_spot_check_ranking(self, danceconvention_en_result):
         """Page 2 competitor should have correct rankings."""
-        result = self.parser.parse(self.VALID_URL, b"%PDF")
+        result = danceconvention_en_result
         # Émilie Perrot & Antonios Pieper: MW ranked them 9
         page_2_comp = [c for c in result.competitors if "Perrot" in c or "Antonios" in c]
         assert len(page_2_comp) == 1, f"Expected 1 page 2 competitor, got {page_2_comp}"
@@ -136,33 +136,33 @@ class TestDanceConventionParser:
     def test_can_parse_content_with_ru_example(self, danceconvention_ru_pdf):
         assert self.parser.can_parse_content(danceconvention_ru_pdf, "scores.pdf")
 
-    def test_parse_ru_competition_name(self, mock_pdfplumber_ru):
-        result = self.parser.parse(self.VALID_RU_URL, b"%PDF")
+    def test_parse_ru_competition_name(self, danceconvention_ru_result):
+        result = danceconvention_ru_result
         assert "Jack'n'Jill Advanced" in result.competition_name
 
-    def test_parse_ru_competitor_count(self, mock_pdfplumber_ru):
-        result = self.parser.parse(self.VALID_RU_URL, b"%PDF")
+    def test_parse_ru_competitor_count(self, danceconvention_ru_result):
+        result = danceconvention_ru_result
         assert result.num_competitors == 10
 
-    def test_parse_ru_judge_count(self, mock_pdfplumber_ru):
-        result = self.parser.parse(self.VALID_RU_URL, b"%PDF")
+    def test_parse_ru_judge_count(self, danceconvention_ru_result):
+        result = danceconvention_ru_result
         assert result.num_judges == 7
 
-    def test_parse_ru_judges(self, mock_pdfplumber_ru):
-        result = self.parser.parse(self.VALID_RU_URL, b"%PDF")
+    def test_parse_ru_judges(self, danceconvention_ru_result):
+        result = danceconvention_ru_result
         assert "Лавр Пахомова" in result.judges
         assert "Юлия Овчинникова" in result.judges
 
-    def test_parse_ru_rankings_complete(self, mock_pdfplumber_ru):
-        result = self.parser.parse(self.VALID_RU_URL, b"%PDF")
+    def test_parse_ru_rankings_complete(self, danceconvention_ru_result):
+        result = danceconvention_ru_result
         for judge in result.judges:
             for competitor in result.competitors:
                 assert competitor in result.rankings[judge], (
                     f"Missing ranking: {judge} -> {competitor}"
                 )
 
-    def test_parse_ru_rankings_valid_range(self, mock_pdfplumber_ru):
-        result = self.parser.parse(self.VALID_RU_URL, b"%PDF")
+    def test_parse_ru_rankings_valid_range(self, danceconvention_ru_result):
+        result = danceconvention_ru_result
         for judge in result.judges:
             for competitor in result.competitors:
                 rank = result.rankings[judge][competitor]
@@ -170,9 +170,9 @@ class TestDanceConventionParser:
                     f"Rank not positive: {judge} -> {competitor} = {rank}"
                 )
 
-    def test_parse_ru_spot_check_ranking(self, mock_pdfplumber_ru):
+    def test_parse_ru_spot_check_ranking(self, danceconvention_ru_result):
         """Verify a specific known ranking from the Russian PDF."""
-        result = self.parser.parse(self.VALID_RU_URL, b"%PDF")
+        result = danceconvention_ru_result
         # Лавр Пахомова ranked Субботин Денис Даниилович & Назар Владиславович Буров 2nd
         comp_319 = [c for c in result.competitors if "Субботин" in c]
         assert len(comp_319) == 1
@@ -134,39 +134,39 @@ class TestEeproParser:
 
     # --- parse (data correctness) ---
 
-    def test_parse_competition_name(self, eepro_html):
-        result = self.parser.parse(self.VALID_URL, eepro_html, division="Advanced")
+    def test_parse_competition_name(self, eepro_advanced_result):
+        result = eepro_advanced_result
         assert "Paris Swing Classic" in result.competition_name
 
-    def test_parse_competitor_count(self, eepro_html):
-        result = self.parser.parse(self.VALID_URL, eepro_html, division="Advanced")
+    def test_parse_competitor_count(self, eepro_advanced_result):
+        result = eepro_advanced_result
         assert result.num_competitors == 12
 
-    def test_parse_judge_count(self, eepro_html):
-        result = self.parser.parse(self.VALID_URL, eepro_html, division="Advanced")
+    def test_parse_judge_count(self, eepro_advanced_result):
+        result = eepro_advanced_result
         assert result.num_judges == 5
 
-    def test_parse_judges(self, eepro_html):
-        result = self.parser.parse(self.VALID_URL, eepro_html, division="Advanced")
+    def test_parse_judges(self, eepro_advanced_result):
+        result = eepro_advanced_result
         assert "CHRISTOPHER ARNOLD" in result.judges
         assert "FRANÇOIS NORMAND" in result.judges
 
-    def test_parse_competitors(self, eepro_html):
-        result = self.parser.parse(self.VALID_URL, eepro_html, division="Advanced")
+    def test_parse_competitors(self, eepro_advanced_result):
+        result = eepro_advanced_result
         assert "Ann Schroeder and Georgia Metz" in result.competitors
 
-    def test_parse_rankings_complete(self, eepro_html):
+    def test_parse_rankings_complete(self, eepro_advanced_result):
         """Every judge has a ranking for every competitor."""
-        result = self.parser.parse(self.VALID_URL, eepro_html, division="Advanced")
+        result = eepro_advanced_result
         for judge in result.judges:
             for competitor in result.competitors:
                 assert competitor in result.rankings[judge], (
                     f"Missing ranking: {judge} -> {competitor}"
                 )
 
-    def test_parse_rankings_valid_range(self, eepro_html):
+    def test_parse_rankings_valid_range(self, eepro_advanced_result):
         """All rankings are between 1 and num_competitors."""
-        result = self.parser.parse(self.VALID_URL, eepro_html, division="Advanced")
+        result = eepro_advanced_result
         for judge in result.judges:
             for competitor in result.competitors:
                 rank = result.rankings[judge][competitor]
@@ -174,9 +174,9 @@ class TestEeproParser:
                     f"Rank out of range: {judge} -> {competitor} = {rank}"
                 )
 
-    def test_parse_spot_check_ranking(self, eepro_html):
+    def test_parse_spot_check_ranking(self, eepro_advanced_result):
         """Verify a specific known ranking."""
-        result = self.parser.parse(self.VALID_URL, eepro_html, division="Advanced")
+        result = eepro_advanced_result
         assert result.rankings["CHRISTOPHER ARNOLD"]["Ann Schroeder and Georgia Metz"] == 1
 
     def test_parse_invalid_html(self):
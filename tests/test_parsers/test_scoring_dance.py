@@ -88,40 +88,40 @@ class TestScoringDanceParser:
 
     # --- parse ---
 
-    def test_parse_competition_name(self, scoring_dance_html):
-        result = self.parser.parse(self.VALID_URL, scoring_dance_html)
+    def test_parse_competition_name(self, scoring_dance_result):
+        result = scoring_dance_result
         assert "Swing Resolution 2026" in result.competition_name
         assert "Novice" in result.competition_name
 
-    def test_parse_competitor_count(self, scoring_dance_html):
-        result = self.parser.parse(self.VALID_URL, scoring_dance_html)
+    def test_parse_competitor_count(self, scoring_dance_result):
+        result = scoring_dance_result
         assert result.num_competitors == 12
 
-    def test_parse_judge_count(self, scoring_dance_html):
-        result = self.parser.parse(self.VALID_URL, scoring_dance_html)
+    def test_parse_judge_count(self, scoring_dance_result):
+        result = scoring_dance_result
         assert result.num_judges == 5
 
-    def test_parse_judges(self, scoring_dance_html):
-        result = self.parser.parse(self.VALID_URL, scoring_dance_html)
+    def test_parse_judges(self, scoring_dance_result):
+        result = scoring_dance_result
         assert "Tyler Garcia" in result.judges
         assert "Agathe-Luce Potier" in result.judges
 
-    def test_parse_competitors(self, scoring_dance_html):
-        result = self.parser.parse(self.VALID_URL, scoring_dance_html)
+    def test_parse_competitors(self, scoring_dance_result):
+        result = scoring_dance_result
         assert "Marie-Therese Kade & Suzanne Guyon" in result.competitors
 
-    def test_parse_rankings_complete(self, scoring_dance_html):
+    def test_parse_rankings_complete(self, scoring_dance_result):
         """Every judge has a ranking for every competitor."""
-        result = self.parser.parse(self.VALID_URL, scoring_dance_html)
+        result = scoring_dance_result
         for judge in result.judges:
             for competitor in result.competitors:
                 assert competitor in result.rankings[judge], (
                     f"Missing ranking: {judge} -> {competitor}"
                 )
 
-    def test_parse_rankings_valid_range(self, scoring_dance_html):
+    def test_parse_rankings_valid_range(self, scoring_dance_result):
         """All rankings are between 1 and num_competitors."""
-        result = self.parser.parse(self.VALID_URL, scoring_dance_html)
+        result = scoring_dance_result
         for judge in result.judges:
             for competitor in result.competitors:
                 rank = result.rankings[judge][competitor]
@@ -129,9 +129,9 @@ class TestScoringDanceParser:
                     f"Rank out of range: {judge} -> {competitor} = {rank}"
                 )
 
-    def test_parse_spot_check_ranking(self, scoring_dance_html):
+    def test_parse_spot_check_ranking(self, scoring_dance_result):
         """Verify a specific known ranking."""
-        result = self.parser.parse(self.VALID_URL, scoring_dance_html)
+        result = scoring_dance_result
         assert result.rankings["Tyler Garcia"]["Marie-Therese Kade & Suzanne Guyon"] == 1
 
     def test_parse_invalid_html(self):
@@ -1,10 +1,15 @@
-"""Shared fixtures for voting system tests."""
+"""Shared fixtures for voting system tests.
+
+The datasets are session-scoped, so every voting system's tests share one
+Scoresheet per dataset, including its cached ranking structures. Tests must
+not modify them.
+"""
 
 import pytest
 from tests.conftest import make_scoresheet
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def clear_winner():
     """Dataset 1: Clear winner, 3 judges, 4 competitors.
 
@@ -23,7 +28,7 @@ def clear_winner():
     })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def disagreement():
     """Dataset 2: Systems disagree, 5 judges, 4 competitors.
 
@@ -44,7 +49,7 @@ def disagreement():
     })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def unanimous():
     """Dataset 3: Unanimous judges, 3 judges, 3 competitors.
 
@@ -62,7 +67,7 @@ def unanimous():
     })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def two_competitors():
     """Dataset 4: Two competitors, 3 judges.
 
@@ -79,7 +84,7 @@ def two_competitors():
     })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def perfect_cycle():
     """Dataset 5: Perfect cycle, 3 judges, 3 competitors.
 
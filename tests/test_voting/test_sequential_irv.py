@@ -449,6 +449,26 @@ class TestSequentialIRV:
         assert tiebreak_info["steps"][2]["method"] == "random"
         assert set(tiebreak_info["steps"][2]["remaining_tied"]) == {"A", "C"}
 
+    def test_random_fallback_is_reproducible(self):
+        """Same scoresheet as above: the random elimination between A and C
+        is seeded from the competitors, so repeated runs agree."""
+        rankings = {
+            "J1": {"A": 1, "B": 2, "C": 4, "D": 3},
+            "J2": {"A": 2, "B": 1, "C": 4, "D": 3},
+            "J3": {"A": 4, "B": 3, "C": 1, "D": 2},
+            "J4": {"A": 4, "B": 3, "C": 2, "D": 1},
+        }
+        results = [
+            self.system.calculate(make_scoresheet("Random Fallback", rankings))
+            for _ in range(5)
+        ]
+        eliminated = {
+            r.details["placement_rounds"][0]["irv_rounds"][0]["eliminated"]
+            for r in results
+        }
+        assert len(eliminated) == 1
+        assert len({tuple(ranking_names(r)) for r in results}) == 1
+
     def test_perfect_cycle_has_all_tied_equal(self, perfect_cycle):
         """Perfect cycle has no way to run IRV, so just declare all tied equal."""
         result = self.system.calculate(perfect_cycle)